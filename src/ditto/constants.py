@@ -1,4 +1,6 @@
 from enum import StrEnum
+from importlib.metadata import PackageNotFoundError, metadata
+
 from requests import Request
 
 
@@ -10,19 +12,13 @@ class QueryDirection(StrEnum):
 
     @staticmethod
     def from_request(request: Request):
-        if request.url.path == "/current":
-            return QueryDirection.CURRENT
-        if request.url.path == "/next":
-            return QueryDirection.FORWARD
-        if request.url.path == "/previous":
-            return QueryDirection.REVERSE
-        if request.url.path == "/random":
-            return QueryDirection.RANDOM
-        else:
-            return None
-
-
-def _get_toml_data():
+        return _PATH_MAP.get(request.url.path)
+
+
+_PATH_MAP = {direction.value: direction for direction in QueryDirection}
+
+
+def _get_toml_data() -> dict:
     import tomllib
 
     with open("pyproject.toml", "rb") as f:
@@ -30,10 +26,21 @@ def _get_toml_data():
     return data
 
 
-TOML_DATA = _get_toml_data()
-PROJECT_NAME = TOML_DATA["project"]["name"]
-PROJECT_DESCRIPTION = TOML_DATA["project"]["description"]
-VERSION = TOML_DATA["project"]["version"]
+def _get_project_meta() -> tuple[str, str, str]:
+    """Return the project ``(name, description, version)``.
+
+    Reads the installed package metadata so no file I/O is needed at import, falling back to ``pyproject.toml`` when
+    running from an uninstalled checkout.
+    """
+    try:
+        meta = metadata("ditto")
+        return meta["Name"], meta["Summary"], meta["Version"]
+    except PackageNotFoundError:
+        project = _get_toml_data()["project"]
+        return project["name"], project["description"], project["version"]
+
+
+PROJECT_NAME, PROJECT_DESCRIPTION, VERSION = _get_project_meta()
 
 APP_META = {
     "title": PROJECT_NAME,
@@ -1,20 +1,95 @@
 from __future__ import annotations
+import hashlib
 import random
+import threading
 import requests
 from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import CancelledError, Executor
+from functools import cached_property
 
 from loguru import logger
-from sqlalchemy import String, ForeignKey, Integer, DateTime, create_engine, select, func, inspect, text
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sqlalchemy import (
+    String,
+    ForeignKey,
+    Index,
+    Integer,
+    DateTime,
+    bindparam,
+    case,
+    create_engine,
+    delete,
+    event,
+    select,
+    func,
+    inspect,
+    insert,
+    literal,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, Session, sessionmaker
 
 from ditto import image_processing
 from ditto.config import settings
-from ditto.constants import QueryDirection
+from ditto.constants import VERSION, QueryDirection
 from ditto.utilities.timer import Timer
 
 OUTPUT_DIR = Path(settings.output_dir).resolve()
+RAW_DIR = OUTPUT_DIR / "raw"
+PROCESSED_DIR = OUTPUT_DIR / "processed"
+FALLBACK_IMAGE_PATH = Path("resources/fallback.png").resolve()
+
+# Shared HTTP session so image downloads reuse pooled keep-alive connections and retry transient failures
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])),
+)
+DOWNLOAD_TIMEOUT = (5, 30)  # (connect, read) seconds
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Settings that change how a render looks. Folded, with the app version, into every processed image's digest
+_RENDER_STYLE_FIELDS = {
+    name for name in type(settings).model_fields if name.startswith(("padding_", "quote_", "title_", "author_"))
+} | {"use_static_bg"}
+_RENDER_STYLE_KEY = VERSION + settings.model_dump_json(include=_RENDER_STYLE_FIELDS)
+
+# One lock per quote ID so concurrent requests for the same missing image share a single download
+_DOWNLOAD_LOCKS: dict[str, threading.Lock] = {}
+
+# Locks for renders in progress, keyed by output path, so concurrent requests for the same image share one render
+_RENDER_LOCKS: dict[Path, threading.Lock] = {}
+
+
+def _ensure_directory(path: Path) -> Path:
+    """Create ``path`` and its parents if they are missing, e.g. after the cache directory was cleared."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _wrap(value, count):
+    """SQL expression wrapping ``value`` into ``[0, count)``; SQL's ``%`` keeps the sign of negative operands."""
+    return (value % count + count) % count
+
+
+def _started(position):
+    """SQL expression treating the not-yet-served position -1 as position 0."""
+    return case((position < 0, 0), else_=position)
+
+
+# Maps a navigation direction to ``f(current_position, total_count) -> new_position`` built as SQL expressions so the
+# database computes the move in the same UPDATE that stores it. Every result is wrapped into ``[0, total_count)``.
+_POSITION_STEPS = {
+    QueryDirection.CURRENT: lambda pos, count: _wrap(_started(pos), count),
+    QueryDirection.FORWARD: lambda pos, count: _wrap(pos + 1, count),
+    QueryDirection.REVERSE: lambda pos, count: _wrap(_started(pos) - 1, count),
+    QueryDirection.RANDOM: lambda pos, count: random.getrandbits(32) % count,
+}
 
 
 # 1. Setup Base and Models
@@ -45,48 +120,78 @@ class Quote(Base):
     image_url: Mapped[Optional[str]] = mapped_column(String)
     image_expiry: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    @property
+    @cached_property
     def image_path_raw(self) -> Path:
         """Return the path for the raw, unprocessed image on disk whether or not it exists.
 
         Returns:
             The resolved file path for the raw image.
         """
-        return OUTPUT_DIR / "raw" / f"{self.id}.jpg"
+        return RAW_DIR / f"{self.id}.jpg"
 
     def get_image_path_processed(self, width: int, height: int) -> Path:
         """Return the path for the processed image on disk whether or not it exists.
 
+        The filename carries a digest of everything drawn onto the image, so editing the quote text, changing the text
+        styling or background settings, or upgrading the app produces a new path instead of serving a stale cached
+        render.
+
         Args:
             width: Target image width in pixels.
             height: Target image height in pixels.
 
         Returns:
-            The resolved file path for the processed image, including dimensions in the filename.
+            The resolved file path for the processed image, including dimensions and render digest in the filename.
         """
-        return OUTPUT_DIR / "processed" / f"{self.id}-{width}x{height}.jpg"
+        render_key = f"{_RENDER_STYLE_KEY}|{self.content}|{self.title}|{self.author}".encode()
+        digest = hashlib.blake2b(render_key, digest_size=8).hexdigest()
+        return PROCESSED_DIR / f"{self.id}-{width}x{height}-{digest}.jpg"
 
     def download_image(self) -> bool:
         """Download the image from ``image_url`` and save it as the raw image file.
 
         If ``image_url`` is not set the download is skipped.
 
+        Concurrent calls for the same quote are coalesced: only the first downloads, the others wait for it and
+        share its result.
+
         Returns:
             ``True`` if the image was downloaded successfully, ``False`` otherwise.
         """
         if not self.image_url:
             return False
 
+        lock = _DOWNLOAD_LOCKS.get(self.id) or _DOWNLOAD_LOCKS.setdefault(self.id, threading.Lock())
+        if not lock.acquire(blocking=False):
+            # Another thread is already downloading this image, wait for it to finish
+            with lock:
+                return self.image_path_raw.is_file()
+        try:
+            return self._download_image()
+        finally:
+            lock.release()
+
+    def _download_image(self) -> bool:
+        """Stream ``image_url`` into the raw image file.  Callers must hold the quote's download lock.
+
+        Returns:
+            ``True`` if the image was downloaded successfully, ``False`` otherwise.
+        """
         t = Timer()
-        logger.debug(f"Downloading image at {self.image_url}...")
+        logger.debug("Downloading image at {}...", self.image_url)
         try:
-            with requests.Session() as session:
-                response = session.get(self.image_url)
-                if response.status_code == 200:
-                    self.image_path_raw.parent.mkdir(parents=True, exist_ok=True)
-                    with open(self.image_path_raw.as_posix(), "wb") as f:
-                        f.write(response.content)
-            logger.debug(f"Took {t.get_elapsed_time()} to download image")
+            with HTTP_SESSION.get(self.image_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code != 200:
+                    logger.error(f"Error downloading image: HTTP {response.status_code}")
+                    return False
+                # Stream into a temporary file so an interrupted download never leaves a truncated raw image behind
+                _ensure_directory(RAW_DIR)
+                partial_path = self.image_path_raw.with_suffix(".part")
+                with open(partial_path.as_posix(), "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                partial_path.replace(self.image_path_raw)
+            logger.debug("Took {} to download image", t.get_elapsed_time())
             return True
         except Exception as e:
             logger.error(f"Error downloading image: {e}")
@@ -97,7 +202,8 @@ class Quote(Base):
 
         If a raw image does not exist locally it will be downloaded first.  When no image is
         available at all, a bundled fallback image is used instead.  Results are cached on disk
-        when ``settings.cache_enabled`` is ``True``.
+        when ``settings.cache_enabled`` is ``True``.  Concurrent calls for the same image are coalesced into a single
+        render.
 
         Args:
             width: Target width in pixels.  Defaults to ``settings.default_width``.
@@ -108,28 +214,49 @@ class Quote(Base):
         """
         width = width or settings.default_width
         height = height or settings.default_height
-        fallback_image_path = Path.cwd() / Path("resources/fallback.png")
 
         output_path = self.get_image_path_processed(width, height)
-        image_path_raw = self.image_path_raw
 
-        if output_path.is_file() and settings.cache_enabled:
+        if settings.cache_enabled and output_path.is_file():
             return output_path
 
-        if settings.use_static_bg:
-            image_path_raw = fallback_image_path
-        elif not image_path_raw.is_file():
-            if self.image_url:
-                self.download_image()
-            else:
-                image_path_raw = fallback_image_path
+        lock = _RENDER_LOCKS.get(output_path) or _RENDER_LOCKS.setdefault(output_path, threading.Lock())
+        if not lock.acquire(blocking=False):
+            # Another thread is rendering this exact image, wait for it and share its result
+            with lock:
+                return output_path if output_path.is_file() else None
+        try:
+            # The lock may have been picked up just as an earlier render released it, so check the cache again
+            if settings.cache_enabled and output_path.is_file():
+                return output_path
+            return self._render_image(output_path, width, height)
+        finally:
+            lock.release()
+            # Only forget the lock if no other thread has registered a new one for this path meanwhile
+            if _RENDER_LOCKS.get(output_path) is lock:
+                _RENDER_LOCKS.pop(output_path, None)
+
+    def _render_image(self, output_path: Path, width: int, height: int) -> Optional[Path]:
+        """Render the quote onto its background image at ``output_path``.  Callers must hold the path's render lock.
+
+        Args:
+            output_path: Where to save the processed image.
+            width: Target width in pixels.
+            height: Target height in pixels.
 
-        # If download failed and we have no file, use fallback
-        if not image_path_raw.is_file():
-            image_path_raw = fallback_image_path
+        Returns:
+            ``output_path`` on success, or ``None`` if processing failed.
+        """
+        if settings.use_static_bg:
+            image_path_raw = FALLBACK_IMAGE_PATH
+        else:
+            image_path_raw = self.image_path_raw
+            # Download the raw image if we don't have it yet, use the fallback if there is no image or it failed
+            if not image_path_raw.is_file() and not self.download_image():
+                image_path_raw = FALLBACK_IMAGE_PATH
 
         t = Timer()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_directory(PROCESSED_DIR)
         try:
             result = image_processing.process_image(
                 image_path_raw.as_posix(),
@@ -140,7 +267,14 @@ class Quote(Base):
                 self.author or "",
             )
             if result:
-                logger.debug(f"Took {t.get_elapsed_time()} to process image: {output_path.as_posix()}")
+                logger.debug("Took {} to process image: {}", t.get_elapsed_time(), output_path.as_posix())
+                # Drop cached renders of older versions of this quote at the same size, including the undigested
+                # names used before renders were keyed by content
+                if settings.cache_enabled:
+                    for stale_path in output_path.parent.glob(f"{self.id}-{width}x{height}-*.jpg"):
+                        if stale_path != output_path:
+                            stale_path.unlink(missing_ok=True)
+                    (output_path.parent / f"{self.id}-{width}x{height}.jpg").unlink(missing_ok=True)
                 return output_path
             else:
                 logger.error(f"Failed to process image: {output_path.as_posix()}")
@@ -159,6 +293,7 @@ class Client(Base):
         current_position: The client's current index within its shuffled quote sequence.
         default_width: Default display width in pixels for this client.
         default_height: Default display height in pixels for this client.
+        sequence_length: Number of quotes in the client's sequence, kept in step with its ``sequence`` rows.
         sequence: One-to-many relationship to the client's shuffled quote order.
     """
 
@@ -169,6 +304,7 @@ class Client(Base):
     current_position: Mapped[int] = mapped_column(Integer, default=-1)
     default_width: Mapped[int] = mapped_column(Integer, default=settings.default_width)
     default_height: Mapped[int] = mapped_column(Integer, default=settings.default_height)
+    sequence_length: Mapped[int] = mapped_column(Integer, default=0)
 
     # Relationship to their specific shuffled deck
     sequence: Mapped[List["ClientSequence"]] = relationship(back_populates="client")
@@ -177,7 +313,8 @@ class Client(Base):
 class ClientSequence(Base):
     """SQLAlchemy model mapping a client to a quote at a specific position in their shuffled deck.
 
-    The composite primary key is ``(client_id, quote_id, position)``.
+    The composite primary key is ``(client_id, quote_id, position)``.  A unique ``(client_id, position)`` index
+    backs the per-request position lookup.
 
     Attributes:
         client_id: Foreign key to :class:`Client`.
@@ -188,6 +325,7 @@ class ClientSequence(Base):
     """
 
     __tablename__ = "client_sequences"
+    __table_args__ = (Index("ix_client_sequences_client_position", "client_id", "position", unique=True),)
 
     client_id: Mapped[int] = mapped_column(ForeignKey("clients.id"), primary_key=True)
     quote_id: Mapped[str] = mapped_column(ForeignKey("quotes.id"), primary_key=True)
@@ -197,6 +335,35 @@ class ClientSequence(Base):
     quote: Mapped["Quote"] = relationship()
 
 
+# Stamped into SQLite's ``PRAGMA user_version`` once _migrate_db has run. Bump it whenever a migration step is added.
+_SCHEMA_VERSION = 1
+
+# Dialect-specific ``insert`` constructs supporting ``ON CONFLICT DO UPDATE``; other dialects fall back to merge
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+# Non-nullable columns the INSERT half of an upsert needs, rows missing any of them are merged instead
+_UPSERT_REQUIRED_FIELDS = {"id", "db_id", "content"}
+
+# Statements on the per-request path are built once with bound parameters, so every call hits the compiled cache
+_SELECT_CLIENT_BY_NAME = select(Client).where(Client.client_name == bindparam("client_name"))
+_SELECT_CLIENT_DECK = select(Client.id, Client.sequence_length).where(Client.client_name == bindparam("client_name"))
+_SELECT_QUOTE_COUNT = select(func.count(Quote.id))
+_SELECT_QUOTE_AT_POSITION = (
+    select(Quote)
+    .join(ClientSequence, ClientSequence.quote_id == Quote.id)
+    .where(ClientSequence.client_id == bindparam("client_id"), ClientSequence.position == bindparam("position"))
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection for WAL journaling with fewer fsyncs."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
+
+
 # 2. The Engine Manager
 class QuoteManager:
     """High-level manager for quote storage, client registration, and sequenced quote retrieval.
@@ -211,12 +378,28 @@ class QuoteManager:
     def __init__(self, db_url: str = settings.database_url):
         self.db_url = db_url
         self.engine = create_engine(db_url)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
         self._migrate_db()
         self.Session = sessionmaker(bind=self.engine)
 
+        # Names of clients whose sequence is known to contain every quote. Cleared whenever a new quote is inserted.
+        self._synced_clients: set[str] = set()
+        self._quotes_generation = 0
+        self._sync_lock = threading.Lock()
+
     def _migrate_db(self):
-        """Lightweight migration: add any new columns to existing tables."""
+        """Lightweight migration: add any new columns to existing tables.
+
+        SQLite databases record the applied schema version, so an up-to-date database skips the inspection entirely.
+        """
+        is_sqlite = self.engine.dialect.name == "sqlite"
+        if is_sqlite:
+            with self.engine.connect() as conn:
+                if conn.execute(text("PRAGMA user_version")).scalar() == _SCHEMA_VERSION:
+                    return
+
         insp = inspect(self.engine)
         if "clients" in insp.get_table_names():
             existing_cols = {col["name"] for col in insp.get_columns("clients")}
@@ -237,29 +420,81 @@ class QuoteManager:
                         )
                     )
                     logger.info("Migrated clients table: added default_height column")
+                if "sequence_length" not in existing_cols:
+                    conn.execute(text("ALTER TABLE clients ADD COLUMN sequence_length INTEGER NOT NULL DEFAULT 0"))
+                    conn.execute(
+                        text(
+                            "UPDATE clients SET sequence_length ="
+                            " (SELECT COUNT(*) FROM client_sequences WHERE client_sequences.client_id = clients.id)"
+                        )
+                    )
+                    logger.info("Migrated clients table: added sequence_length column")
+        if "client_sequences" in insp.get_table_names():
+            existing_indexes = {index["name"] for index in insp.get_indexes("client_sequences")}
+            for index in ClientSequence.__table__.indexes:
+                if index.name not in existing_indexes:
+                    index.create(self.engine)
+                    logger.info(f"Migrated client_sequences table: added {index.name} index")
+
+        if is_sqlite:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"PRAGMA user_version = {_SCHEMA_VERSION}"))
 
     def upsert_quote(self, quote_data: dict):
         """Insert a new quote or update an existing one.
 
         Args:
-            quote_data: Dictionary whose keys match :class:`Quote` column names. Must include ``"id"`` at a minimum.
+            quote_data: Dictionary whose keys match :class:`Quote` column names. Must include ``"id"`` at a
+                minimum.
         """
-        with self.Session() as session:
-            stmt = select(Quote).where(Quote.id == quote_data["id"])
-            existing = session.scalar(stmt)
-
-            if existing:
-                # Update existing fields
-                for key, value in quote_data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
+        self.upsert_quotes([quote_data])
+
+    def upsert_quotes(self, quotes_data: List[dict]):
+        """Insert or update many quotes in a single transaction.
+
+        Complete rows are written with an ``INSERT ... ON CONFLICT DO UPDATE`` that only overwrites the supplied
+        fields. Partial updates missing ``"db_id"`` or ``"content"`` cannot satisfy the INSERT half, so they are merged
+        onto the existing row instead.
+
+        Args:
+            quotes_data: Dictionaries whose keys match :class:`Quote` column names. Each must include ``"id"``.
+        """
+        # Last write wins for repeated IDs, a single upsert statement may not touch the same row twice
+        quotes_by_id = {quote_data["id"]: quote_data for quote_data in quotes_data}
+
+        upsert_insert = _UPSERT_INSERTS.get(self.engine.dialect.name)
+
+        # Only the supplied fields are updated, so rows are grouped by the set of fields they carry
+        rows_by_columns = {}
+        merge_rows = []
+        for quote_data in quotes_by_id.values():
+            if upsert_insert is None or not _UPSERT_REQUIRED_FIELDS.issubset(quote_data):
+                merge_rows.append(quote_data)
             else:
-                # Create new
-                new_quote = Quote(**quote_data)
-                session.add(new_quote)
+                rows_by_columns.setdefault(tuple(sorted(quote_data)), []).append(quote_data)
+
+        with self.Session() as session:
+            quote_count = session.scalar(_SELECT_QUOTE_COUNT)
+
+            for quote_data in merge_rows:
+                session.merge(Quote(**quote_data))
+
+            for columns, rows in rows_by_columns.items():
+                stmt = upsert_insert(Quote)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Quote.id],
+                    set_={column: stmt.excluded[column] for column in columns if column != "id"},
+                )
+                session.execute(stmt, rows)
 
+            inserted = session.scalar(_SELECT_QUOTE_COUNT) > quote_count
             session.commit()
 
+        if inserted:
+            with self._sync_lock:
+                self._quotes_generation += 1
+                self._synced_clients.clear()
+
     def get_stats(self) -> dict:
         """Return database statistics.
 
@@ -267,9 +502,12 @@ class QuoteManager:
             A dictionary with ``client_count``, ``quote_count``, and ``database_file`` keys.
         """
         try:
+            stmt = select(
+                select(func.count()).select_from(Client).scalar_subquery(),
+                select(func.count()).select_from(Quote).scalar_subquery(),
+            )
             with self.Session() as session:
-                client_count = session.query(Client).count()
-                quote_count = session.query(Quote).count()
+                client_count, quote_count = session.execute(stmt).one()
         except Exception:
             client_count = -1
             quote_count = -1
@@ -284,23 +522,67 @@ class QuoteManager:
         with self.Session() as session:
             return list(session.scalars(select(Quote.id)).all())
 
+    def get_quotes_missing_raw_image(self) -> List[Quote]:
+        """Return every quote that has an ``image_url`` but no raw image on disk yet.
+
+        Returns:
+            A list of detached :class:`Quote` instances.
+        """
+        with self.Session() as session:
+            quotes = session.scalars(select(Quote).where(Quote.image_url.is_not(None))).all()
+            return [quote for quote in quotes if not quote.image_path_raw.is_file()]
+
+    def pregenerate_images(self, executor: Executor) -> int:
+        """Render every quote at each registered client's default size, blocking until all renders have finished.
+
+        Only worthwhile when ``settings.cache_enabled`` is ``True``, since otherwise each request renders its image
+        again anyway.
+
+        Args:
+            executor: Pool to render on.  Keep it separate from the one serving requests, every render is queued at
+                once and would otherwise hold up live requests.
+
+        Returns:
+            The number of images rendered successfully.  Renders cancelled by shutting down ``executor`` are not
+            counted.
+        """
+        with self.Session() as session:
+            quotes = session.scalars(select(Quote)).all()
+            sizes = session.execute(select(Client.default_width, Client.default_height).distinct()).all()
+
+        futures = [executor.submit(quote.process_image, width, height) for width, height in sizes for quote in quotes]
+        rendered_count = 0
+        for future in futures:
+            try:
+                if future.result():
+                    rendered_count += 1
+            except CancelledError:
+                pass
+        return rendered_count
+
     def delete_quote(self, quote_id: str):
         """Delete a quote and all associated client-sequence entries.
 
         Args:
             quote_id: The ID of the quote to remove.
         """
-        from sqlalchemy import delete
-
         with self.Session() as session:
-            quote = session.get(Quote, quote_id)
-            if quote:
-                # Delete any client sequences referencing this quote
-                session.execute(delete(ClientSequence).where(ClientSequence.quote_id == quote_id))
+            # Shrink the deck of every client holding this quote, then delete those sequence entries
+            holders_stmt = select(ClientSequence.client_id).where(ClientSequence.quote_id == quote_id)
+            session.execute(
+                update(Client).where(Client.id.in_(holders_stmt)).values(sequence_length=Client.sequence_length - 1)
+            )
+            session.execute(delete(ClientSequence).where(ClientSequence.quote_id == quote_id))
+
+            # Delete by primary key without loading the quote
+            deleted_count = session.execute(delete(Quote).where(Quote.id == quote_id)).rowcount
+            session.commit()
+
+        # Forget the quote's download lock so the registry only ever holds current quotes
+        _DOWNLOAD_LOCKS.pop(quote_id, None)
 
-                session.delete(quote)
-                session.commit()
-                logger.info(f"Deleted quote {quote_id}")
+        if deleted_count:
+            logger.info(f"Deleted quote {quote_id}")
 
     def register_client(self, client_name: str, width: Optional[int] = None, height: Optional[int] = None) -> Client:
         """Register a new client or return the existing one.
@@ -317,34 +599,47 @@ class QuoteManager:
             The newly created or pre-existing :class:`Client` instance.
         """
         with self.Session() as session:
-            # Check if client exists
-            client = session.scalar(select(Client).where(Client.client_name == client_name))
-            if client:
-                # Ensure they have a sequence if they exist but somehow no sequence?
-                # (Logic handled in sync_new_quotes, but effectively we assume if client exists, they might need sync)
-                return client
-
-            # Create new client with optional custom dimensions
-            new_client = Client(
-                client_name=client_name,
-                default_width=width or settings.default_width,
-                default_height=height or settings.default_height,
-            )
-            session.add(new_client)
-            session.flush()  # Get the ID before committing
-
-            # Create the shuffled deck
-            all_quote_ids = session.scalars(select(Quote.id)).all()
-            shuffled_ids = list(all_quote_ids)
-            random.shuffle(shuffled_ids)
-
-            sequences = [
-                ClientSequence(client_id=new_client.id, quote_id=qid, position=idx)
-                for idx, qid in enumerate(shuffled_ids)
-            ]
-            session.add_all(sequences)
+            client = self._register_client(session, client_name, width=width, height=height)
+            # Expunge so the returned client stays usable after the commit
+            session.expunge(client)
             session.commit()
-            return new_client
+            return client
+
+    def _register_client(
+        self, session: Session, client_name: str, width: Optional[int] = None, height: Optional[int] = None
+    ) -> Client:
+        """Return the named client, creating it with a shuffled deck inside ``session`` if it does not exist.
+
+        The caller is responsible for committing.
+
+        Args:
+            session: An active SQLAlchemy session.
+            client_name: Unique name identifying the client.
+            width: Default display width in pixels.  Falls back to ``settings.default_width``.
+            height: Default display height in pixels.  Falls back to ``settings.default_height``.
+
+        Returns:
+            The newly created or pre-existing :class:`Client` instance.
+        """
+        # Check if client exists
+        client = session.scalar(_SELECT_CLIENT_BY_NAME, {"client_name": client_name})
+        if client:
+            # Existing clients are brought up to date by _sync_new_quotes
+            return client
+
+        # Create new client with optional custom dimensions
+        new_client = Client(
+            client_name=client_name,
+            default_width=width or settings.default_width,
+            default_height=height or settings.default_height,
+        )
+        session.add(new_client)
+        session.flush()  # Get the ID before committing
+
+        # Create the shuffled deck
+        new_client.sequence_length = self._append_shuffled_quotes(session, new_client.id, start_position=0)
+        session.flush()
+        return new_client
 
     def sync_new_quotes(self, client_name: str):
         """Append any newly added quotes to the client's shuffled sequence.
@@ -356,41 +651,121 @@ class QuoteManager:
             client_name: The unique name of the client to sync.
         """
         with self.Session() as session:
-            # 1. Get the client
-            client = session.scalar(select(Client).where(Client.client_name == client_name))
-            if not client:
-                # Need to register first? Or just return
-                return
+            synced_count = self._sync_new_quotes(session, client_name)
+            session.commit()
 
-            # 2. Find Quote IDs the client DOES NOT have in their sequence yet
-            existing_quote_ids_stmt = select(ClientSequence.quote_id).where(ClientSequence.client_id == client.id)
+        if synced_count:
+            logger.info(f"Synced {synced_count} new quotes for {client_name}.")
 
-            new_quotes_stmt = select(Quote.id).where(Quote.id.not_in(existing_quote_ids_stmt))
-            new_quote_ids = list(session.scalars(new_quotes_stmt).all())
+    def _sync_new_quotes(self, session: Session, client_name: str) -> int:
+        """Append any newly added quotes to the client's shuffled sequence inside ``session``.
 
-            if not new_quote_ids:
-                return  # Everything is already synced
+        The caller is responsible for committing.
 
-            # 3. Shuffle only the new quotes
-            random.shuffle(new_quote_ids)
+        Args:
+            session: An active SQLAlchemy session.
+            client_name: The unique name of the client to sync.
 
-            # 4. Find the current max position for this client
-            max_pos = session.scalar(
-                select(func.max(ClientSequence.position)).where(ClientSequence.client_id == client.id)
+        Returns:
+            The number of quotes appended.
+        """
+        # 1. Get the client's id and deck size, no need to hydrate the whole row
+        row = session.execute(_SELECT_CLIENT_DECK, {"client_name": client_name}).first()
+        if not row:
+            return 0
+        client_id, sequence_length = row
+
+        # 2. Cheap probe: a deck holds each quote at most once, so matching the quote count means it is complete
+        if sequence_length >= session.scalar(_SELECT_QUOTE_COUNT):
+            return 0  # Everything is already synced
+
+        # 3. Find the current max position for this client
+        max_pos = session.scalar(select(func.max(ClientSequence.position)).where(ClientSequence.client_id == client_id))
+        # If max_pos is None (empty deck), start at -1 so first item is at 0
+        if max_pos is None:
+            max_pos = -1
+
+        # 4. Shuffle and append the quotes the client DOES NOT have in their sequence yet
+        existing_quote_ids_stmt = select(ClientSequence.quote_id).where(ClientSequence.client_id == client_id)
+        synced_count = self._append_shuffled_quotes(
+            session,
+            client_id,
+            start_position=max_pos + 1,
+            where=Quote.id.not_in(existing_quote_ids_stmt),
+        )
+        if synced_count:
+            session.execute(
+                update(Client)
+                .where(Client.id == client_id)
+                .values(sequence_length=Client.sequence_length + synced_count)
             )
-            # If max_pos is None (empty deck), start at -1 so first item is at 0
-            if max_pos is None:
-                max_pos = -1
+        return synced_count
 
-            # 5. Append them
-            new_sequences = [
-                ClientSequence(client_id=client.id, quote_id=qid, position=max_pos + 1 + idx)
-                for idx, qid in enumerate(new_quote_ids)
-            ]
+    @staticmethod
+    def _append_shuffled_quotes(session: Session, client_id: int, start_position: int, where=None) -> int:
+        """Append quotes to a client's sequence in a random order chosen by the database.
 
-            session.add_all(new_sequences)
-            session.commit()
-            logger.info(f"Synced {len(new_quote_ids)} new quotes for {client_name}.")
+        The shuffle and insert run as a single ``INSERT ... SELECT`` ordered by ``random()``, so quote IDs are never
+        loaded into Python.
+
+        Args:
+            session: An active SQLAlchemy session.
+            client_id: Primary key of the client whose sequence to extend.
+            start_position: Position assigned to the first appended quote.
+            where: Optional filter restricting which quotes are appended.  Defaults to all quotes.
+
+        Returns:
+            The number of quotes appended.
+        """
+        position = func.row_number().over(order_by=func.random()) - 1 + start_position
+        source = select(literal(client_id), Quote.id, position)
+        if where is not None:
+            source = source.where(where)
+        stmt = insert(ClientSequence).from_select(["client_id", "quote_id", "position"], source)
+        return session.execute(stmt).rowcount
+
+    def _sync_client(
+        self, session: Session, client_name: str, width: Optional[int] = None, height: Optional[int] = None
+    ) -> Optional[int]:
+        """Register and sync a client inside ``session`` unless it is already known to be up to date.
+
+        Skips the database round-trips of :meth:`_register_client` and :meth:`_sync_new_quotes` for clients that
+        have been synced since the last new quote was inserted.  Pass the result to :meth:`_mark_client_synced`
+        once the session has been committed.
+
+        Args:
+            session: An active SQLAlchemy session.
+            client_name: Unique name identifying the client.
+            width: Default display width in pixels, used only if the client is new.
+            height: Default display height in pixels, used only if the client is new.
+
+        Returns:
+            The quote generation the sync was based on, or ``None`` if the client was already up to date.
+        """
+        with self._sync_lock:
+            if client_name in self._synced_clients:
+                return None
+            generation = self._quotes_generation
+
+        self._register_client(session, client_name, width=width, height=height)
+        synced_count = self._sync_new_quotes(session, client_name)
+        if synced_count:
+            logger.info(f"Synced {synced_count} new quotes for {client_name}.")
+        return generation
+
+    def _mark_client_synced(self, client_name: str, generation: Optional[int]):
+        """Remember that a client's deck is complete after a committed :meth:`_sync_client`.
+
+        Args:
+            client_name: Unique name identifying the client.
+            generation: The value returned by :meth:`_sync_client`.
+        """
+        if generation is None:
+            return
+        with self._sync_lock:
+            # A quote inserted while the sync ran may be missing from the deck, so leave the client to resync
+            if generation == self._quotes_generation:
+                self._synced_clients.add(client_name)
 
     def _get_quote_at_position(self, session: Session, client: Client, position: int) -> Optional[Quote]:
         """Return the quote at a specific position in a client's shuffled sequence.
@@ -403,13 +778,21 @@ class QuoteManager:
         Returns:
             The :class:`Quote` at the given position, or ``None`` if not found.
         """
-        stmt = (
-            select(Quote)
-            .join(ClientSequence)
-            .where(ClientSequence.client_id == client.id)
-            .where(ClientSequence.position == position)
-        )
-        return session.scalar(stmt)
+        return session.scalar(_SELECT_QUOTE_AT_POSITION, {"client_id": client.id, "position": position})
+
+    def get_next_quote(self, client: Client) -> Optional[Quote]:
+        """Return the quote a ``FORWARD`` request would serve the client next, without moving its position.
+
+        Args:
+            client: The :class:`Client` whose sequence to look ahead in.
+
+        Returns:
+            The next :class:`Quote`, or ``None`` if the client has no quotes.
+        """
+        if not client.sequence_length:
+            return None
+        with self.Session() as session:
+            return self._get_quote_at_position(session, client, (client.current_position + 1) % client.sequence_length)
 
     def get_client(self, client_name: str) -> Optional[Client]:
         """Look up a client by its unique name.
@@ -421,7 +804,7 @@ class QuoteManager:
             The matching :class:`Client`, or ``None`` if no client has that name.
         """
         with self.Session() as session:
-            return session.scalar(select(Client).where(Client.client_name == client_name))
+            return session.scalar(_SELECT_CLIENT_BY_NAME, {"client_name": client_name})
 
     def add_client(self, client_name: str, width: Optional[int] = None, height: Optional[int] = None) -> Client:
         """Add a new client or return the existing one, with optional custom display dimensions.
@@ -469,9 +852,10 @@ class QuoteManager:
                 client.default_height = height
             if position is not None:
                 client.current_position = position
-            session.commit()
-            # Expunge so the object is usable outside the session
+            session.flush()
+            # Expunge so the returned client stays usable after the commit
             session.expunge(client)
+            session.commit()
             return client
 
     def get_quote(
@@ -499,44 +883,32 @@ class QuoteManager:
             when the client could not be found after registration.
         """
 
-        # Ensure client exists and is synced – pass width/height so that a
-        # brand-new client stores them as defaults.
-        self.register_client(client_name, width=width, height=height)
-        self.sync_new_quotes(client_name)
-
         with self.Session() as session:
-            client = session.scalar(select(Client).where(Client.client_name == client_name))
-            if not client:
-                return None, None
-
-            # Get total count of quotes for this client
-            count_stmt = select(func.count(ClientSequence.quote_id)).where(ClientSequence.client_id == client.id)
-            total_count = session.scalar(count_stmt) or 0
-
-            if total_count == 0:
-                return None, client
-
-            current_pos = client.current_position
-            new_pos = current_pos
-
-            if direction == QueryDirection.CURRENT:
-                # If -1 (just started), move to 0
-                if current_pos < 0:
-                    new_pos = 0
-            elif direction == QueryDirection.FORWARD:
-                new_pos = current_pos + 1
-                if new_pos >= total_count:
-                    new_pos = 0  # Loop back to start
-            elif direction == QueryDirection.REVERSE:
-                new_pos = current_pos - 1
-                if new_pos < 0:
-                    new_pos = total_count - 1  # Loop back to end
-            elif direction == QueryDirection.RANDOM:
-                new_pos = random.randint(0, total_count - 1)
-
-            # Update client position
-            client.current_position = new_pos
-            session.add(client)
+            # Ensure client exists and is synced – pass width/height so that a
+            # brand-new client stores them as defaults.
+            sync_generation = self._sync_client(session, client_name, width=width, height=height)
+
+            # Move and read back the client in one statement; clients with an empty deck are left untouched
+            new_pos = _POSITION_STEPS[direction](Client.current_position, Client.sequence_length)
+            stmt = (
+                update(Client)
+                .where(Client.client_name == client_name, Client.sequence_length > 0)
+                .values(current_position=new_pos)
+                .returning(Client)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            client = session.scalar(stmt)
+            has_quotes = client is not None
+            if not has_quotes:
+                # Either the client is unknown or it has no quotes to serve
+                client = session.scalar(_SELECT_CLIENT_BY_NAME, {"client_name": client_name})
+
+            # Expunge so the returned client stays usable after the commit
+            if client is not None:
+                session.expunge(client)
             session.commit()
+            self._mark_client_synced(client_name, sync_generation)
 
-            return self._get_quote_at_position(session, client, new_pos), client
+            if not has_quotes:
+                return None, client
+            return self._get_quote_at_position(session, client, client.current_position), client
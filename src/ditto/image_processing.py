@@ -50,13 +50,18 @@ def process_image(
             new_width = int(new_width * scale_factor)
             new_height = int(new_height * scale_factor)
 
-        logger.debug(f"Original {orig_width}x{orig_height} resized to {new_width}x{new_height} before cropping")
-        img.resize(new_width, new_height)
-
-        img.gravity = "center"  # Use 'center' gravity
-        img.crop(width=dimensions[0], height=dimensions[1])
-
-        logger.info(f"Cropped to {img.width}x{img.height}")
+        # Skip the resampling pass when the source is already the right size
+        if (new_width, new_height) != (orig_width, orig_height):
+            logger.debug(
+                "Original {}x{} resized to {}x{} before cropping", orig_width, orig_height, new_width, new_height
+            )
+            img.resize(new_width, new_height)
+
+        if (img.width, img.height) != tuple(dimensions):
+            img.gravity = "center"  # Use 'center' gravity
+            img.crop(width=dimensions[0], height=dimensions[1])
+
+            logger.info(f"Cropped to {img.width}x{img.height}")
 
         # 2. COLOR PREP: Compensate for the ink's reflectivity
         # Modulate(brightness, saturation, hue)
@@ -1,15 +1,18 @@
 """Application lifecycle management, global state, and background tasks."""
 
 import asyncio
+import os
 import time
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 
 from loguru import logger
 from fastapi import FastAPI
 
-from ditto import database, notion
+from ditto import database, notion, text_rendering
+from ditto.config import settings
 
 # Initialize QuoteManager
 quote_manager = database.QuoteManager()
@@ -18,12 +21,43 @@ quote_manager = database.QuoteManager()
 START_TIME = time.time()
 RECENT_CONNECTIONS = deque(maxlen=10)
 
+# Live renders share a pool; the heavy lifting happens in ImageMagick and Pillow, which release the GIL
+IMAGE_WORKERS = min(8, os.cpu_count() or 1)
 
-async def schedule_daily_sync():
+# Pre-generation gets its own small pool so live requests never queue behind a full pass over every quote
+PREGENERATE_WORKERS = 2
+
+
+def _log_font_warmup_failure(future: Future):
+    """Done-callback surfacing errors from the background font cache warm-up, e.g. a missing font file."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.opt(exception=future.exception()).error("Failed to warm the font cache")
+
+
+async def pregenerate_images(executor: ThreadPoolExecutor):
+    """Render every quote at each client's size ahead of time, when caching is enabled.
+
+    Args:
+        executor: Pool to render on, separate from the one serving requests.
+    """
+    if not settings.cache_enabled:
+        return
+
+    try:
+        rendered_count = await asyncio.to_thread(quote_manager.pregenerate_images, executor)
+        logger.info(f"Pre-generated {rendered_count} images.")
+    except Exception as e:
+        logger.error(f"Error pre-generating images: {e}")
+
+
+async def schedule_daily_sync(pregenerate_executor: ThreadPoolExecutor):
     """Background task that syncs the Notion database every day at midnight.
 
-    Runs in an infinite loop, sleeping until the next midnight before triggering a sync. On failure the loop
-    pauses for 60 seconds to prevent rapid retries.
+    Runs in an infinite loop, sleeping until the next midnight before triggering a sync and then pre-generating the
+    new images. On failure the loop pauses for 60 seconds to prevent rapid retries.
+
+    Args:
+        pregenerate_executor: Pool to pre-generate images on after each sync.
 
     Raises:
         asyncio.CancelledError: Propagated when the task is cancelled during shutdown.
@@ -42,6 +76,7 @@ async def schedule_daily_sync():
             logger.info("Starting scheduled daily Notion sync...")
             await notion.sync_notion_db(quote_manager)
             logger.info("Daily Notion sync completed.")
+            await pregenerate_images(pregenerate_executor)
         except asyncio.CancelledError:
             logger.info("Daily sync task cancelled.")
             raise
@@ -55,8 +90,9 @@ async def schedule_daily_sync():
 async def lifespan(app: FastAPI):
     """FastAPI lifespan context manager that handles startup and shutdown tasks.
 
-    On startup, performs an initial Notion database sync and launches the daily sync background task.
-    On shutdown, cancels the background task and waits for it to finish.
+    On startup, creates the image render pool on ``app.state.image_executor``, starts warming the font cache,
+    performs an initial Notion database sync and launches the image pre-generation and daily sync background tasks.
+    On shutdown, cancels the background tasks and waits for them to finish, then stops the image render pools.
 
     Args:
         app: The FastAPI application instance.
@@ -64,6 +100,13 @@ async def lifespan(app: FastAPI):
     Yields:
         None: Control is yielded to the application between startup and shutdown.
     """
+    # Pools are created per lifespan, a pool that has been shut down cannot be reused
+    image_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="ditto-image")
+    app.state.image_executor = image_executor
+
+    # Load fonts in the background, alongside the sync, so the first render does not pay for it
+    image_executor.submit(text_rendering.warm_font_cache).add_done_callback(_log_font_warmup_failure)
+
     # Startup: Sync data from Notion
     logger.info("Starting up: Syncing Notion data...")
     try:
@@ -71,15 +114,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to sync Notion data on startup: {e}")
 
+    # Pre-generate images in the background, the server starts accepting requests straight away
+    pregenerate_executor = ThreadPoolExecutor(max_workers=PREGENERATE_WORKERS, thread_name_prefix="ditto-pregenerate")
+    pregenerate_task = asyncio.create_task(pregenerate_images(pregenerate_executor))
+
     # Start daily sync task
-    sync_task = asyncio.create_task(schedule_daily_sync())
+    sync_task = asyncio.create_task(schedule_daily_sync(pregenerate_executor))
 
     # Yield control to the application
     yield
 
     # Handle shutdown
     logger.info("Shutting down: Cancelling background tasks...")
+    pregenerate_task.cancel()
     sync_task.cancel()
+    try:
+        await pregenerate_task
+    except asyncio.CancelledError:
+        logger.info("Image pre-generation task cancelled successfully.")
+
     try:
         await sync_task
     except asyncio.CancelledError:
@@ -87,3 +140,7 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         # Catch unexpected crashes that happened during the task's life
         logger.error(f"Daily sync task failed with an error: {e}")
+
+    # Drop queued background renders, only finishing those already running
+    await asyncio.to_thread(pregenerate_executor.shutdown, wait=True, cancel_futures=True)
+    await asyncio.to_thread(image_executor.shutdown, wait=True, cancel_futures=True)
@@ -1,5 +1,6 @@
 import sys
 import time
+import asyncio
 import platform
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -23,6 +24,22 @@ image_meta = {
 }
 
 
+def _prerender_next_quote(client: database.Client, width: int, height: int):
+    """Render the quote the client will be served next so it is already cached when it asks for it.
+
+    Args:
+        client: The client that was just served.
+        width: Width of the image.
+        height: Height of the image.
+    """
+    try:
+        next_quote = quote_manager.get_next_quote(client)
+        if next_quote:
+            next_quote.process_image(width, height)
+    except Exception:
+        logger.exception("Error pre-rendering next quote")
+
+
 async def _process_quote(
     request: Request,
     client_override: Optional[str] = None,
@@ -60,8 +77,10 @@ async def _process_quote(
         effective_width = width or (client.default_width if client else settings.default_width)
         effective_height = height or (client.default_height if client else settings.default_height)
 
-        # Process image using the effective dimensions
-        image_path = quote_item.process_image(effective_width, effective_height)
+        # Process image using the effective dimensions, off the event loop so other requests keep being served
+        image_path = await asyncio.get_running_loop().run_in_executor(
+            request.app.state.image_executor, quote_item.process_image, effective_width, effective_height
+        )
 
         if image_path is None or not image_path.is_file():
             return JSONResponse(status_code=500, content={"message": "Failed to process image"})
@@ -73,6 +92,10 @@ async def _process_quote(
 
         logger.info(f'response: "{response.path}" generated in {t.get_elapsed_time()} seconds')
 
+        # Renders are only reused from disk when caching is enabled
+        if settings.cache_enabled and client:
+            request.app.state.image_executor.submit(_prerender_next_quote, client, effective_width, effective_height)
+
         # Track connection
         elapsed_ms = t.get_elapsed_time_ms()
         RECENT_CONNECTIONS.append(
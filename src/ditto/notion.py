@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import Any, Callable, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -17,13 +18,44 @@ class NotionError(RuntimeError):
     pass
 
 
-rate_limit_event = asyncio.Event()
-rate_limit_event.set()
+class RateLimiter:
+    """Space out requests evenly so a steady stream of calls stays under an API's rate limit.
+
+    Args:
+        rate: Number of requests allowed per ``period``.
+        period: Length of the rate window in seconds.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.interval = period / rate
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        """Claim the next free request slot, sleeping until it arrives."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def pause(self, seconds: float):
+        """Hold back every request not yet scheduled for at least ``seconds``, e.g. after a 429."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+# Notion allows an average of three requests per second per integration
+notion_rate_limiter = RateLimiter(3)
+
+# Number of blocks requested per call when looking for a page's image, the most Notion allows
+IMAGE_BLOCK_PAGE_SIZE = 100
 
 
 async def api_request(api_func: Callable, *args, max_retries: int = 5, initial_backoff: int = 1, **kwargs) -> Any:
     """Make a Notion API request with automatic retry on rate limit errors.
 
+    Requests are paced by ``notion_rate_limiter`` so steady traffic stays below Notion's limit instead of
+    waiting on 429 responses.
+
     Args:
         api_func: The Notion API function to call.
         *args: Positional arguments to pass to the API function.
@@ -41,18 +73,16 @@ async def api_request(api_func: Callable, *args, max_retries: int = 5, initial_b
     backoff = initial_backoff
 
     while retries <= max_retries:
-        await rate_limit_event.wait()
+        await notion_rate_limiter.acquire()
         try:
             response = await api_func(*args, **kwargs)
             return response
         except APIResponseError as error:
-            # If rate limit error. sleep and try again.
+            # If rate limit error, hold back all requests and try again.
             if error.status == 429:
                 retry_after = int(error.headers.get("Retry-After", backoff))
                 logger.error(f"Rate limit exceeded. Retrying in {retry_after} seconds...")
-                rate_limit_event.clear()
-                await asyncio.sleep(retry_after)
-                rate_limit_event.set()
+                notion_rate_limiter.pause(retry_after)
                 backoff *= 2
                 retries += 1
             # If not a rate limit error, re-raise
@@ -66,22 +96,45 @@ async def api_request(api_func: Callable, *args, max_retries: int = 5, initial_b
 async def fetch_image_block(page_id: str) -> Optional[dict]:
     """Return the first image block from a page. Note that this is just the image block, not the actual image.
 
+    Blocks are requested in full-size batches and paging stops as soon as an image is found.
+
     Args:
         page_id: The ID of the page to fetch the image block from.
 
     Returns:
         The image block from the page.
     """
-    try:
-        blocks = await api_request(notion_api.blocks.children.list, page_id)
-    except APIResponseError as error:
-        logger.exception(error)
-        blocks = {"results": []}
+    request_kwargs = {"page_size": IMAGE_BLOCK_PAGE_SIZE}
+    while True:
+        try:
+            blocks = await api_request(notion_api.blocks.children.list, page_id, **request_kwargs)
+        except APIResponseError as error:
+            logger.exception(error)
+            return None
+
+        image_block = next((block["image"] for block in blocks["results"] if block["type"] == "image"), None)
+        if image_block is not None or not blocks.get("has_more"):
+            return image_block
+        request_kwargs = {"page_size": IMAGE_BLOCK_PAGE_SIZE, "start_cursor": blocks["next_cursor"]}
 
-    for block in blocks["results"]:
-        if block["type"] == "image":
-            return block["image"]
-    return None
+
+async def fetch_image_blocks(page_ids: List[str], concurrency: int = 3) -> List[Optional[dict]]:
+    """Return the first image block of each page, fetching up to ``concurrency`` pages at a time.
+
+    Args:
+        page_ids: The IDs of the pages to fetch the image blocks from.
+        concurrency: Maximum number of simultaneous requests.
+
+    Returns:
+        The image block of each page, in the same order as ``page_ids``.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(page_id: str) -> Optional[dict]:
+        async with semaphore:
+            return await fetch_image_block(page_id)
+
+    return await asyncio.gather(*(_fetch(page_id) for page_id in page_ids))
 
 
 class NotionPage:
@@ -92,6 +145,8 @@ class NotionPage:
         image_block: The image block from the page.
     """
 
+    __slots__ = ("page_id", "quote", "title", "author", "image_url", "image_expiry_time")
+
     page_id: str
     quote: str
     title: str
@@ -101,29 +156,32 @@ class NotionPage:
 
     def __init__(self, page: dict, image_block: Optional[dict] = None):
         self.page_id = page["id"]
-        quote = ""
+        properties = page["properties"]
+
         # Safely extract title
-        if "Name" in page["properties"] and "title" in page["properties"]["Name"]:
-            for part in page["properties"]["Name"]["title"]:
-                quote += part["plain_text"]
-        self.quote = quote
+        name = properties.get("Name") or {}
+        self.quote = "".join(part["plain_text"] for part in name.get("title", ()))
 
         self.title = "Unknown"
-        if "TITLE" in page["properties"] and page["properties"]["TITLE"]["rich_text"]:
-            self.title = page["properties"]["TITLE"]["rich_text"][0]["plain_text"]
+        title_text = properties.get("TITLE", {}).get("rich_text")
+        if title_text:
+            self.title = title_text[0]["plain_text"]
 
         self.author = "Unknown"
-        if "AUTHOR" in page["properties"] and page["properties"]["AUTHOR"]["rich_text"]:
-            self.author = page["properties"]["AUTHOR"]["rich_text"][0]["plain_text"]
+        author_text = properties.get("AUTHOR", {}).get("rich_text")
+        if author_text:
+            self.author = author_text[0]["plain_text"]
 
         self.image_url = None
         self.image_expiry_time = None
 
         if image_block:
-            if image_block["type"] == "file":
-                self.image_url = image_block["file"]["url"]
-                self.image_expiry_time = datetime.fromisoformat(image_block["file"]["expiry_time"])
-            elif image_block["type"] == "external":
+            block_type = image_block["type"]
+            if block_type == "file":
+                image_file = image_block["file"]
+                self.image_url = image_file["url"]
+                self.image_expiry_time = datetime.fromisoformat(image_file["expiry_time"])
+            elif block_type == "external":
                 self.image_url = image_block["external"]["url"]
                 self.image_expiry_time = None
 
@@ -134,6 +192,9 @@ class NotionPage:
 async def fetch_all_pages(database_id: str) -> List[dict]:
     """Fetch all pages from the Notion database.
 
+    Pages are requested in batches of 100, the most Notion returns per call, so the sequential cursor walk takes as
+    few round trips as possible.
+
     Args:
         database_id: The ID of the database to fetch pages from.
 
@@ -142,7 +203,7 @@ async def fetch_all_pages(database_id: str) -> List[dict]:
     """
     logger.info(f"Fetching all pages from database {database_id}...")
     try:
-        response = await api_request(notion_api.databases.query, database_id=database_id)
+        response = await api_request(notion_api.databases.query, database_id=database_id, page_size=100)
     except APIResponseError as error:
         logger.exception(error)
         return []
@@ -151,7 +212,10 @@ async def fetch_all_pages(database_id: str) -> List[dict]:
     while response["has_more"]:
         try:
             response = await api_request(
-                notion_api.databases.query, database_id=database_id, start_cursor=response["next_cursor"]
+                notion_api.databases.query,
+                database_id=database_id,
+                page_size=100,
+                start_cursor=response["next_cursor"],
             )
             results.extend(response["results"])
         except APIResponseError as error:
@@ -172,10 +236,8 @@ async def sync_notion_db(quote_manager):
 
     raw_pages = await fetch_all_pages(config.settings.notion_database_id)
 
-    synced_count = 0
     skipped_count = 0
-    active_ids = set()
-
+    active_pages = []
     for page in raw_pages:
         # Check simple filters (not archived, not in trash)
         # And check "DISPLAY" or equivalent properties if they exist
@@ -192,25 +254,33 @@ async def sync_notion_db(quote_manager):
             skipped_count += 1
             continue
 
-        # Fetch image block which contains the image URL and expiry time
-        image_block = await fetch_image_block(page["id"])
+        active_pages.append(page)
+
+    # Fetch image blocks which contain the image URL and expiry time, overlapping the requests
+    image_blocks = await fetch_image_blocks([page["id"] for page in active_pages])
 
+    active_ids = set()
+    quotes_data = []
+    for page, image_block in zip(active_pages, image_blocks):
         notion_page = NotionPage(page, image_block)
 
-        # Upsert into QuoteManager
-        quote_data = {
-            "id": notion_page.page_id,
-            "db_id": notion_page.page_id,
-            "content": notion_page.quote,
-            "title": notion_page.title,
-            "author": notion_page.author,
-            "image_url": notion_page.image_url,
-            "image_expiry": notion_page.image_expiry_time,
-        }
-
-        quote_manager.upsert_quote(quote_data)
+        quotes_data.append(
+            {
+                "id": notion_page.page_id,
+                "db_id": notion_page.page_id,
+                "content": notion_page.quote,
+                "title": notion_page.title,
+                "author": notion_page.author,
+                "image_url": notion_page.image_url,
+                "image_expiry": notion_page.image_expiry_time,
+            }
+        )
         active_ids.add(notion_page.page_id)
-        synced_count += 1
+
+    # Upsert into QuoteManager in a single transaction
+    if quotes_data:
+        quote_manager.upsert_quotes(quotes_data)
+    synced_count = len(quotes_data)
 
     # Cleanup: Remove quotes from DB that are not in active_ids
     existing_ids = set(quote_manager.get_all_quote_ids())
@@ -222,3 +292,31 @@ async def sync_notion_db(quote_manager):
         deleted_count += 1
 
     logger.info(f"Sync complete. Synced: {synced_count}, Skipped: {skipped_count}, Deleted: {deleted_count}")
+
+    if not config.settings.use_static_bg:
+        await prefetch_images(quote_manager)
+
+
+async def prefetch_images(quote_manager, concurrency: int = 4):
+    """Download the raw background image for every quote that does not have one on disk yet.
+
+    Notion-hosted image URLs expire, so fetching right after a sync means requests never wait on a download.
+    Downloads run in worker threads, at most ``concurrency`` at a time.
+
+    Args:
+        quote_manager: Instance of QuoteManager (from ditto.database)
+        concurrency: Maximum number of simultaneous downloads.
+    """
+    quotes = quote_manager.get_quotes_missing_raw_image()
+    if not quotes:
+        return
+
+    logger.info(f"Prefetching {len(quotes)} images...")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _download(quote) -> bool:
+        async with semaphore:
+            return await asyncio.to_thread(quote.download_image)
+
+    results = await asyncio.gather(*(_download(quote) for quote in quotes))
+    logger.info(f"Prefetched {sum(results)} of {len(quotes)} images.")
@@ -1,5 +1,6 @@
 from typing import Tuple
 from math import ceil
+from functools import lru_cache
 
 import numpy as np
 from loguru import logger
@@ -9,6 +10,39 @@ from PIL.ImageFont import FreeTypeFont
 from ditto.config import settings
 from ditto.utilities.timer import Timer
 
+# Largest quote font size tried when fitting the quote, the quote font is loaded at this size to start the search
+QUOTE_MAX_FONT_SIZE = 96
+
+
+@lru_cache(maxsize=128)
+def _get_font(path: str, size: int, index: int) -> FreeTypeFont:
+    """Load a TrueType font once per path, size and face index, reusing it for every later render.
+
+    Args:
+        path: Path to the font file.
+        size: Font height in pixels.
+        index: Face index within the font collection.
+
+    Returns:
+        The loaded font.
+    """
+    return ImageFont.truetype(path, size, index=index)
+
+
+def _font_variant(font: FreeTypeFont, size: int) -> FreeTypeFont:
+    """Return ``font`` at another size, served from the font cache when it was loaded from a file path.
+
+    Args:
+        font: The font to resize.
+        size: The new font height in pixels.
+
+    Returns:
+        The resized font.
+    """
+    if isinstance(font.path, str):
+        return _get_font(font.path, size, font.index)
+    return font.font_variant(size=size)
+
 
 def render_text(dimensions: tuple[int, int], quote: str, title: str, author: str) -> np.ndarray:
     """Renders a text-based image with a quote, title, and author overlaid on it. The function calculates dimensions
@@ -38,8 +72,8 @@ def render_text(dimensions: tuple[int, int], quote: str, title: str, author: str
     safe_width = int(dimensions[0] - (padding_w_pixels * 2))
     safe_quote_height = int(quote_h_pixels - (padding_h_pixels * 2) - 8)
 
-    font = ImageFont.truetype(settings.quote_font, index=settings.quote_font_index)
-    text, font = _fit_text_bbox(quote, font, safe_width, safe_quote_height)
+    font = _get_font(settings.quote_font, QUOTE_MAX_FONT_SIZE, settings.quote_font_index)
+    text, font = _fit_text_bbox(quote, font, safe_width, safe_quote_height, max_font_size=QUOTE_MAX_FONT_SIZE)
     quote_stroke = ceil(_lerp(1, 4, ((font.size - 24) / 24)))
 
     draw = ImageDraw.Draw(pil_image)
@@ -47,13 +81,13 @@ def render_text(dimensions: tuple[int, int], quote: str, title: str, author: str
     draw.text(xy, text, settings.quote_color, font=font, align="center", stroke_width=quote_stroke, stroke_fill="black")
 
     # Add Title
-    font = ImageFont.truetype(settings.title_font, title_h_pixels, index=settings.title_font_index)
+    font = _get_font(settings.title_font, title_h_pixels, settings.title_font_index)
     font = _fit_text_width(title, font, safe_width, max_font_size=title_h_pixels)
     xy = (dimensions[0] - padding_w_pixels, dimensions[1] - padding_h_pixels - author_h_pixels)
     draw.text(xy, title, settings.title_color, font=font, anchor="rd", stroke_width=2, stroke_fill="black")
 
     # Add Author
-    font = ImageFont.truetype(settings.author_font, author_h_pixels, index=settings.author_font_index)
+    font = _get_font(settings.author_font, author_h_pixels, settings.author_font_index)
     font = _fit_text_width(author, font, safe_width, max_font_size=author_h_pixels)
     xy = (dimensions[0] - padding_w_pixels, dimensions[1] - padding_h_pixels)
     logger.info(f"Drawing author {author} at xy={xy}")
@@ -63,6 +97,14 @@ def render_text(dimensions: tuple[int, int], quote: str, title: str, author: str
     return np.array(pil_image)
 
 
+def warm_font_cache():
+    """Render a sample quote at the default size so the first real request finds its fonts already loaded."""
+    t = Timer()
+    sample_quote = "The quick brown fox jumps over the lazy dog. " * 3
+    render_text((settings.default_width, settings.default_height), sample_quote, "Title", "Author")
+    logger.debug("Took {} to warm the font cache", t.get_elapsed_time())
+
+
 def _lerp(a: float, b: float, t: float) -> float:
     """Linearly interpolates between two values a and b based on a parameter t.
 
@@ -99,21 +141,21 @@ def _fit_text_width(
     Returns:
         The font size to fit the text to the given width.
     """
-    logger.debug(f"Trying to fit text {len(text)} character long into {max_width} wide box.")
+    logger.debug("Trying to fit text {} character long into {} wide box.", len(text), max_width)
 
     t = Timer()
     for font_size in reversed(range(min_font_size, max_font_size + 1, step_size)):
-        logger.debug(f"Trying font size {font_size}")
-        test_font = font.font_variant(size=font_size)
+        logger.debug("Trying font size {}", font_size)
+        test_font = _font_variant(font, font_size)
         line_width = int(test_font.getlength(text))
         if line_width > max_width:
             continue
 
-        logger.debug(f"Successfully fit text using {font_size} in {t.get_elapsed_time()} seconds")
+        logger.debug("Successfully fit text using {} in {} seconds", font_size, t.get_elapsed_time())
         return test_font
 
-    logger.debug(f"Failed to fit text to {max_width}, returning min font size {min_font_size}")
-    return font.font_variant(size=min_font_size)
+    logger.debug("Failed to fit text to {}, returning min font size {}", max_width, min_font_size)
+    return _font_variant(font, min_font_size)
 
 
 def _fit_text_bbox(
@@ -143,24 +185,24 @@ def _fit_text_bbox(
         The wrapped text and a font size.
     """
 
-    logger.debug(f"Trying to fit text {len(text)} character long into {max_width}x{max_height} pixels")
+    logger.debug("Trying to fit text {} character long into {}x{} pixels", len(text), max_width, max_height)
 
     max_font_size = min(max_font_size, max_width)
 
     t = Timer()
     for font_size in reversed(range(min_font_size, max_font_size + 1, step_size)):
-        logger.debug(f"Trying font size {font_size}")
-        test_font = font.font_variant(size=font_size)
+        logger.debug("Trying font size {}", font_size)
+        test_font = _font_variant(font, font_size)
 
         wrapped_text = _wrap_text(text, test_font, max_width)
         new_num_lines = wrapped_text.count("\n") + 1
         test_height = (new_num_lines * font_size) + (new_num_lines * spacing)
 
         if test_height > max_height:
-            logger.debug(f"Failed total height {test_height} > {max_height}")
+            logger.debug("Failed total height {} > {}", test_height, max_height)
             continue
 
-        logger.debug(f"Successfully fit text using {font_size} in {t.get_elapsed_time()} seconds")
+        logger.debug("Successfully fit text using {} in {} seconds", font_size, t.get_elapsed_time())
         return wrapped_text, test_font
 
     index = text.rfind(". ")
@@ -170,8 +212,8 @@ def _fit_text_bbox(
             text[: index + 1], font, max_width, max_height, spacing, min_font_size, max_font_size, step_size
         )
 
-    logger.debug(f"Unable to fit text, returning min value of {min_font_size}")
-    font = font.font_variant(size=min_font_size)
+    logger.debug("Unable to fit text, returning min value of {}", min_font_size)
+    font = _font_variant(font, min_font_size)
     wrapped_text = _wrap_text(text, font, max_width)
     return wrapped_text, font
 
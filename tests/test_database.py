@@ -1,6 +1,13 @@
 """Tests for ditto.database — QuoteManager with in-memory SQLite."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, inspect, text
+
 from ditto.constants import QueryDirection
+from ditto.database import _DOWNLOAD_LOCKS, _RENDER_LOCKS, _SCHEMA_VERSION, Quote, QuoteManager
 
 
 # ---------------------------------------------------------------------------
@@ -20,6 +27,36 @@ class TestUpsertQuote:
         ids = quote_manager.get_all_quote_ids()
         assert ids.count("q1") == 1  # still one record
 
+    def test_bulk_insert_and_update(self, quote_manager):
+        """upsert_quotes inserts new quotes and updates existing ones in one call."""
+        quote_manager.upsert_quote({"id": "q1", "db_id": "q1", "content": "v1"})
+        quote_manager.upsert_quotes(
+            [
+                {"id": "q1", "db_id": "q1", "content": "v2"},
+                {"id": "q2", "db_id": "q2", "content": "new"},
+            ]
+        )
+        assert sorted(quote_manager.get_all_quote_ids()) == ["q1", "q2"]
+
+    def test_partial_update_keeps_other_fields(self, quote_manager):
+        """Optional fields missing from an update are left untouched."""
+        quote_manager.upsert_quote({"id": "q1", "db_id": "q1", "content": "v1", "author": "A"})
+        quote_manager.upsert_quote({"id": "q1", "db_id": "q1", "content": "v2"})
+        with quote_manager.Session() as session:
+            quote = session.get(Quote, "q1")
+            assert quote.content == "v2"
+            assert quote.author == "A"
+
+    def test_update_with_only_id_and_content(self, quote_manager):
+        """A partial update carrying only ``id`` and ``content`` updates the existing row."""
+        quote_manager.upsert_quote({"id": "q1", "db_id": "db", "content": "v1", "author": "A"})
+        quote_manager.upsert_quote({"id": "q1", "content": "v2"})
+        with quote_manager.Session() as session:
+            quote = session.get(Quote, "q1")
+            assert quote.content == "v2"
+            assert quote.db_id == "db"
+            assert quote.author == "A"
+
 
 # ---------------------------------------------------------------------------
 # Stats
@@ -48,6 +85,58 @@ class TestGetAllQuoteIds:
         assert set(ids) == {q["id"] for q in sample_quotes}
 
 
+# ---------------------------------------------------------------------------
+# Missing raw images
+# ---------------------------------------------------------------------------
+class TestGetQuotesMissingRawImage:
+    def test_only_quotes_with_url(self, quote_manager, sample_quotes):
+        """Quotes without an image_url are never returned."""
+        assert quote_manager.get_quotes_missing_raw_image() == []
+
+    def test_returns_quote_without_file(self, quote_manager):
+        quote_manager.upsert_quote(
+            {"id": "q-img", "db_id": "q-img", "content": "c", "image_url": "https://example.com/missing.jpg"}
+        )
+        quotes = quote_manager.get_quotes_missing_raw_image()
+        assert [q.id for q in quotes] == ["q-img"]
+
+
+# ---------------------------------------------------------------------------
+# Pre-generating images
+# ---------------------------------------------------------------------------
+class TestPregenerateImages:
+    def test_renders_each_quote_at_each_client_size(self, quote_manager, sample_quotes, monkeypatch):
+        rendered = []
+        monkeypatch.setattr(Quote, "process_image", lambda self, w, h: rendered.append((self.id, w, h)) or True)
+        quote_manager.register_client("small", width=400, height=300)
+        quote_manager.register_client("large", width=1024, height=768)
+        quote_manager.register_client("large-too", width=1024, height=768)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert quote_manager.pregenerate_images(executor) == len(sample_quotes) * 2
+        assert sorted(rendered) == sorted((q["id"], w, h) for q in sample_quotes for w, h in [(400, 300), (1024, 768)])
+
+    def test_no_clients_renders_nothing(self, quote_manager, sample_quotes):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert quote_manager.pregenerate_images(executor) == 0
+
+    def test_cancelled_renders_not_counted(self, quote_manager, sample_quotes, monkeypatch):
+        """Shutting the pool down mid-pass drops the queued renders without raising."""
+        monkeypatch.setattr(Quote, "process_image", lambda self, w, h: True)
+        quote_manager.register_client("small", width=400, height=300)
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(release.wait, 5)  # occupy the only worker so every render stays queued
+
+        def shutdown():
+            time.sleep(0.05)
+            executor.shutdown(wait=False, cancel_futures=True)
+            release.set()
+
+        threading.Thread(target=shutdown).start()
+        assert quote_manager.pregenerate_images(executor) == 0
+
+
 # ---------------------------------------------------------------------------
 # Delete
 # ---------------------------------------------------------------------------
@@ -64,6 +153,19 @@ class TestDeleteQuote:
         ids = quote_manager.get_all_quote_ids()
         assert "quote-0" not in ids
 
+    def test_delete_shrinks_client_deck(self, quote_manager, sample_quotes):
+        """Deleting a quote decrements the stored sequence length of clients holding it."""
+        quote_manager.register_client("client-a")
+        quote_manager.delete_quote("quote-0")
+        assert quote_manager.get_client("client-a").sequence_length == len(sample_quotes) - 1
+
+    def test_delete_forgets_download_lock(self, quote_manager, sample_quotes, monkeypatch):
+        monkeypatch.setattr(Quote, "_download_image", lambda self: False)
+        Quote(id="quote-0", content="c", image_url="https://example.com/img.jpg").download_image()
+        assert "quote-0" in _DOWNLOAD_LOCKS
+        quote_manager.delete_quote("quote-0")
+        assert "quote-0" not in _DOWNLOAD_LOCKS
+
     def test_delete_nonexistent_is_noop(self, quote_manager):
         """Deleting an ID that doesn't exist doesn't raise."""
         quote_manager.delete_quote("does-not-exist")  # should not raise
@@ -85,6 +187,14 @@ class TestRegisterClient:
         stats = quote_manager.get_stats()
         assert stats["client_count"] == 1
 
+    def test_deck_covers_every_quote_once(self, quote_manager, sample_quotes):
+        """Walking the whole deck visits each quote exactly once."""
+        seen = []
+        for _ in sample_quotes:
+            quote, _ = quote_manager.get_quote("new-client", QueryDirection.FORWARD)
+            seen.append(quote.id)
+        assert sorted(seen) == sorted(q["id"] for q in sample_quotes)
+
     def test_idempotent(self, quote_manager, sample_quotes):
         """Re-registering returns the same client without duplicating."""
         c1 = quote_manager.register_client("client-a")
@@ -99,6 +209,15 @@ class TestRegisterClient:
         assert client.default_width == 1024
         assert client.default_height == 768
 
+    def test_returned_client_usable_after_commit(self):
+        """The returned client stays readable with the default expire-on-commit sessions."""
+        qm = QuoteManager(db_url="sqlite:///:memory:")
+        client = qm.register_client("client-a", width=640)
+        assert client.client_name == "client-a"
+        assert client.default_width == 640
+        assert qm.update_client(client.id, position=2).current_position == 2
+        qm.engine.dispose()
+
 
 # ---------------------------------------------------------------------------
 # Sync new quotes
@@ -115,6 +234,7 @@ class TestSyncNewQuotes:
         # Now fetch with direction to verify the new quote is reachable
         all_ids = quote_manager.get_all_quote_ids()
         assert "quote-new" in all_ids
+        assert quote_manager.get_client("client-a").sequence_length == len(sample_quotes) + 1
 
     def test_skips_existing(self, quote_manager, sample_quotes):
         """Syncing when no new quotes exist is a no-op."""
@@ -182,14 +302,183 @@ class TestGetQuote:
         _, client = quote_manager.get_quote("nav-client", QueryDirection.REVERSE)
         assert client.current_position == len(sample_quotes) - 1
 
+    def test_out_of_range_position_wraps(self, quote_manager, sample_quotes):
+        """A stored position past the end of the deck is wrapped back into range."""
+        quote_manager.register_client("nav-client")
+        client = quote_manager.get_client("nav-client")
+        quote_manager.update_client(client.id, position=len(sample_quotes) + 2)
+        quote, client = quote_manager.get_quote("nav-client", QueryDirection.CURRENT)
+        assert quote is not None
+        assert client.current_position == 2
+
+    def test_next_quote_matches_forward(self, quote_manager, sample_quotes):
+        """get_next_quote previews what FORWARD serves without moving the client."""
+        for _ in range(len(sample_quotes)):
+            _, client = quote_manager.get_quote("nav-client", QueryDirection.FORWARD)
+            preview = quote_manager.get_next_quote(client)
+            assert quote_manager.get_client("nav-client").current_position == client.current_position
+            quote, _ = quote_manager.get_quote("nav-client", QueryDirection.FORWARD)
+            assert preview.id == quote.id
+
     def test_random_returns_quote(self, quote_manager, sample_quotes):
         """RANDOM always returns a valid quote."""
         quote, client = quote_manager.get_quote("nav-client", QueryDirection.RANDOM)
         assert quote is not None
         assert 0 <= client.current_position < len(sample_quotes)
 
+    def test_new_quote_reachable_after_first_request(self, quote_manager, sample_quotes):
+        """A quote inserted after a client's first request is added to that client's deck."""
+        quote_manager.get_quote("nav-client", QueryDirection.CURRENT)
+        quote_manager.upsert_quote({"id": "quote-new", "db_id": "quote-new", "content": "New!"})
+
+        seen = set()
+        for _ in range(len(sample_quotes) + 1):
+            quote, _ = quote_manager.get_quote("nav-client", QueryDirection.FORWARD)
+            seen.add(quote.id)
+        assert "quote-new" in seen
+
     def test_empty_database(self, quote_manager):
         """With no quotes, get_quote returns (None, client)."""
         quote, client = quote_manager.get_quote("lonely-client", QueryDirection.CURRENT)
         assert quote is None
         assert client is not None
+
+
+# ---------------------------------------------------------------------------
+# Image downloads
+# ---------------------------------------------------------------------------
+class TestDownloadImage:
+    def test_no_url_skips_download(self):
+        assert Quote(id="q1", content="c").download_image() is False
+
+    def test_concurrent_downloads_coalesce(self, monkeypatch):
+        """A second caller waits for the in-flight download instead of starting another."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_download(self):
+            calls.append(self.id)
+            started.set()
+            release.wait(timeout=5)
+            return False
+
+        monkeypatch.setattr(Quote, "_download_image", slow_download)
+        quote = Quote(id="q-coalesce", content="c", image_url="https://example.com/img.jpg")
+        results = []
+        first = threading.Thread(target=lambda: results.append(quote.download_image()))
+        second = threading.Thread(target=lambda: results.append(quote.download_image()))
+
+        first.start()
+        started.wait(timeout=5)
+        second.start()
+        time.sleep(0.05)
+        release.set()
+        first.join()
+        second.join()
+
+        assert calls == ["q-coalesce"]
+        assert results == [False, False]
+
+
+# ---------------------------------------------------------------------------
+# Image rendering
+# ---------------------------------------------------------------------------
+class TestProcessImage:
+    def test_concurrent_renders_coalesce(self, monkeypatch):
+        """A second request for the same image waits for the in-flight render instead of starting another."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_render(self, output_path, width, height):
+            calls.append((width, height))
+            started.set()
+            release.wait(timeout=5)
+            return None
+
+        monkeypatch.setattr(Quote, "_render_image", slow_render)
+        quote = Quote(id="q-render", content="c")
+        first = threading.Thread(target=quote.process_image, args=(320, 240))
+        second = threading.Thread(target=quote.process_image, args=(320, 240))
+
+        first.start()
+        started.wait(timeout=5)
+        second.start()
+        time.sleep(0.05)
+        release.set()
+        first.join()
+        second.join()
+
+        assert calls == [(320, 240)]
+        assert not _RENDER_LOCKS
+
+    def test_finished_render_keeps_newer_lock(self, monkeypatch):
+        """A render finishing does not drop a lock another thread registered for the same path in the meantime."""
+        newer_lock = threading.Lock()
+
+        def render(self, output_path, width, height):
+            _RENDER_LOCKS[output_path] = newer_lock
+            return None
+
+        monkeypatch.setattr(Quote, "_render_image", render)
+        quote = Quote(id="q-render-newer", content="c")
+        quote.process_image(320, 240)
+        try:
+            assert _RENDER_LOCKS[quote.get_image_path_processed(320, 240)] is newer_lock
+        finally:
+            _RENDER_LOCKS.clear()
+
+
+# ---------------------------------------------------------------------------
+# Processed image paths
+# ---------------------------------------------------------------------------
+class TestProcessedImagePath:
+    def test_stable_for_same_render(self):
+        q1 = Quote(id="q1", content="Hello", title="T", author="A")
+        q2 = Quote(id="q1", content="Hello", title="T", author="A")
+        assert q1.get_image_path_processed(800, 480) == q2.get_image_path_processed(800, 480)
+
+    def test_changes_with_text(self):
+        """Editing the quote text yields a new processed path so stale renders are not served."""
+        before = Quote(id="q1", content="Hello", title="T", author="A").get_image_path_processed(800, 480)
+        after = Quote(id="q1", content="Hello!", title="T", author="A").get_image_path_processed(800, 480)
+        assert before != after
+        assert after.name.startswith("q1-800x480-")
+
+    def test_changes_with_render_style(self, monkeypatch):
+        """Changing the text styling settings or upgrading the app invalidates cached renders."""
+        quote = Quote(id="q1", content="Hello", title="T", author="A")
+        before = quote.get_image_path_processed(800, 480)
+        monkeypatch.setattr("ditto.database._RENDER_STYLE_KEY", "another-style")
+        assert quote.get_image_path_processed(800, 480) != before
+
+
+# ---------------------------------------------------------------------------
+# Schema migration
+# ---------------------------------------------------------------------------
+class TestMigrateDb:
+    def test_legacy_clients_table_migrated_and_stamped(self, tmp_path):
+        """Missing client columns are added once and the schema version is recorded."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(
+                text("CREATE TABLE clients (id INTEGER PRIMARY KEY, client_name VARCHAR, current_position INTEGER)")
+            )
+        engine.dispose()
+
+        qm = QuoteManager(db_url=f"sqlite:///{tmp_path / 'legacy.db'}")
+        columns = {col["name"] for col in inspect(qm.engine).get_columns("clients")}
+        assert {"default_width", "default_height", "sequence_length"} <= columns
+        with qm.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA user_version")).scalar() == _SCHEMA_VERSION
+        qm.engine.dispose()
+
+    def test_current_schema_skips_inspection(self, tmp_path, monkeypatch):
+        QuoteManager(db_url=f"sqlite:///{tmp_path / 'ditto.db'}").engine.dispose()
+
+        def fail_inspect(*args, **kwargs):
+            raise AssertionError("schema inspected on an up-to-date database")
+
+        monkeypatch.setattr("ditto.database.inspect", fail_inspect)
+        QuoteManager(db_url=f"sqlite:///{tmp_path / 'ditto.db'}").engine.dispose()
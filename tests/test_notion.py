@@ -1,7 +1,18 @@
 """Tests for ditto.notion — NotionPage parsing logic."""
 
+import asyncio
 from datetime import datetime
-from ditto.notion import NotionPage
+from unittest.mock import MagicMock
+
+from ditto import notion
+from ditto.notion import (
+    NotionPage,
+    RateLimiter,
+    fetch_all_pages,
+    fetch_image_block,
+    fetch_image_blocks,
+    prefetch_images,
+)
 
 
 def _make_page(
@@ -114,7 +125,150 @@ class TestNotionPage:
 
         assert np.quote == "Hello, World!"
 
+    def test_slots_only(self):
+        """Pages carry no per-instance __dict__."""
+        np = NotionPage(_make_page())
+        assert not hasattr(np, "__dict__")
+
     def test_repr(self):
         """__repr__ returns a readable identifier."""
         np = NotionPage(_make_page(page_id="xyz"))
         assert repr(np) == "NotionPage[xyz]"
+
+
+class TestRateLimiter:
+    @staticmethod
+    def _acquire_all(limiter, count, monkeypatch):
+        """Acquire ``count`` slots at a frozen clock and return the requested sleeps."""
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(notion.time, "monotonic", lambda: 100.0)
+        monkeypatch.setattr(notion.asyncio, "sleep", fake_sleep)
+
+        async def _run():
+            for _ in range(count):
+                await limiter.acquire()
+
+        asyncio.run(_run())
+        return sleeps
+
+    def test_spaces_requests_evenly(self, monkeypatch):
+        sleeps = self._acquire_all(RateLimiter(4), 3, monkeypatch)
+        assert sleeps == [0.25, 0.5]
+
+    def test_pause_delays_next_request(self, monkeypatch):
+        limiter = RateLimiter(4)
+        monkeypatch.setattr(notion.time, "monotonic", lambda: 100.0)
+        limiter.pause(2)
+        assert self._acquire_all(limiter, 1, monkeypatch) == [2.0]
+
+
+class TestFetchAllPages:
+    def test_walks_cursors_in_full_batches(self, monkeypatch):
+        responses = [
+            {"results": [_make_page("page-1")], "has_more": True, "next_cursor": "cursor-2"},
+            {"results": [_make_page("page-2")], "has_more": False},
+        ]
+        calls = []
+
+        async def fake_api_request(api_func, *args, **kwargs):
+            calls.append(kwargs)
+            return responses[len(calls) - 1]
+
+        monkeypatch.setattr(notion, "api_request", fake_api_request)
+
+        pages = asyncio.run(fetch_all_pages("db-1"))
+
+        assert [page["id"] for page in pages] == ["page-1", "page-2"]
+        assert calls == [
+            {"database_id": "db-1", "page_size": 100},
+            {"database_id": "db-1", "page_size": 100, "start_cursor": "cursor-2"},
+        ]
+
+
+class TestFetchImageBlock:
+    @staticmethod
+    def _serve(monkeypatch, responses):
+        """Make api_request return ``responses`` in order and record the keyword arguments of each call."""
+        calls = []
+
+        async def fake_api_request(api_func, *args, **kwargs):
+            calls.append(kwargs)
+            return responses[len(calls) - 1]
+
+        monkeypatch.setattr(notion, "api_request", fake_api_request)
+        return calls
+
+    def test_image_in_first_batch(self, monkeypatch):
+        image = _file_image_block()
+        calls = self._serve(
+            monkeypatch,
+            [{"results": [{"type": "paragraph"}, {"type": "image", "image": image}], "has_more": True}],
+        )
+
+        assert asyncio.run(fetch_image_block("page-1")) == image
+        assert calls == [{"page_size": notion.IMAGE_BLOCK_PAGE_SIZE}]
+
+    def test_pages_until_image_found(self, monkeypatch):
+        image = _external_image_block()
+        calls = self._serve(
+            monkeypatch,
+            [
+                {"results": [{"type": "paragraph"}], "has_more": True, "next_cursor": "cursor-2"},
+                {"results": [{"type": "image", "image": image}], "has_more": False},
+            ],
+        )
+
+        assert asyncio.run(fetch_image_block("page-1")) == image
+        assert calls[1] == {"page_size": 100, "start_cursor": "cursor-2"}
+
+    def test_no_image(self, monkeypatch):
+        self._serve(monkeypatch, [{"results": [{"type": "paragraph"}], "has_more": False}])
+        assert asyncio.run(fetch_image_block("page-1")) is None
+
+
+class TestFetchImageBlocks:
+    def test_results_keep_page_order_and_respect_concurrency(self, monkeypatch):
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch_image_block(page_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"page": page_id}
+
+        monkeypatch.setattr(notion, "fetch_image_block", fake_fetch_image_block)
+        page_ids = [f"page-{i}" for i in range(6)]
+
+        blocks = asyncio.run(fetch_image_blocks(page_ids, concurrency=2))
+
+        assert blocks == [{"page": page_id} for page_id in page_ids]
+        assert peak == 2
+
+
+class TestPrefetchImages:
+    def test_downloads_every_missing_image(self):
+        """Each quote reported as missing a raw image is downloaded once."""
+        quotes = [MagicMock(), MagicMock()]
+        for quote in quotes:
+            quote.download_image.return_value = True
+        quote_manager = MagicMock()
+        quote_manager.get_quotes_missing_raw_image.return_value = quotes
+
+        asyncio.run(prefetch_images(quote_manager, concurrency=1))
+
+        for quote in quotes:
+            quote.download_image.assert_called_once_with()
+
+    def test_nothing_missing(self):
+        """No downloads are attempted when every image is already on disk."""
+        quote_manager = MagicMock()
+        quote_manager.get_quotes_missing_raw_image.return_value = []
+
+        asyncio.run(prefetch_images(quote_manager))
@@ -3,7 +3,15 @@
 import pytest
 from PIL import ImageFont
 
-from ditto.text_rendering import _lerp, _wrap_text, _fit_text_width, _fit_text_bbox
+from ditto.text_rendering import (
+    _lerp,
+    _wrap_text,
+    _fit_text_width,
+    _fit_text_bbox,
+    _font_variant,
+    _get_font,
+    warm_font_cache,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -89,3 +97,28 @@ class TestFitTextBbox:
         )
         # Should have truncated to "First sentence." or returned a wrapped version
         assert isinstance(wrapped, str)
+
+
+# ---------------------------------------------------------------------------
+# Font cache
+# ---------------------------------------------------------------------------
+class TestFontCache:
+    FONT_PATH = "resources/fonts/Charter.ttc"
+
+    def test_same_font_reused(self):
+        assert _get_font(self.FONT_PATH, 30, 0) is _get_font(self.FONT_PATH, 30, 0)
+
+    def test_variant_served_from_cache(self):
+        font = _get_font(self.FONT_PATH, 30, 3)
+        variant = _font_variant(font, 42)
+        assert variant.size == 42
+        assert variant is _get_font(self.FONT_PATH, 42, 3)
+
+    def test_variant_of_in_memory_font(self, default_font):
+        """Fonts not loaded from a path are resized directly."""
+        assert _font_variant(default_font, 12).size == 12
+
+    def test_warm_font_cache_loads_fonts(self):
+        _get_font.cache_clear()
+        warm_font_cache()
+        assert _get_font.cache_info().currsize > 0